@@ -20,6 +20,8 @@
 __author__ = "John Eslick"
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import os
 import logging
 from platform import machine
@@ -83,31 +85,45 @@ def print_license():
     return 0
 
 
-def print_build_info():
+_alias_maps = {"Platform": binary_distro_map, "Architecture": binary_arch_map}
+
+
+@lru_cache(maxsize=None)
+def _reverse_alias_map(name):
+    """Map each canonical name in the named alias map to its sorted aliases."""
+    rmap = defaultdict(list)
+    for k, v in _alias_maps[name].items():
+        rmap[v].append(k)
+    return {canon: tuple(sorted(aliases)) for canon, aliases in rmap.items()}
+
+
+@lru_cache(maxsize=None)
+def _get_platform(distro):
+    """Resolve the platform name for distro ("auto" to detect it)."""
     fd, _ = idaes.commands.util.download_bin._get_file_downloader(False, None)
+    _, platform = idaes.commands.util.download_bin._get_arch_and_platform(fd, distro)
+    return platform
+
 
+def print_build_info():
     print_header("Build Information")
 
     print("\nAll Builds (Platform-Architecture):")
     for build in base_platforms:
         print(f"   {build}")
 
-    for name, data in zip(
-        ("Platform", "Architecture"),
-        (binary_distro_map, binary_arch_map),
-    ):
+    for name in _alias_maps:
         print(f"\n{name} aliases:")
-        rmap = defaultdict(list)
-        _ = {rmap[v].append(k) for k, v in data.items()}
+        rmap = _reverse_alias_map(name)
         w = max((len(name) for name in rmap))
         name_fmt = f"{{name:>{w}s}}"
         for name in sorted(rmap.keys()):
-            aliases = ", ".join(sorted(rmap[name]))
+            aliases = ", ".join(rmap[name])
             fname = name_fmt.format(name=name)
             print(f"    {fname}: {aliases}")
 
     print("\nCurrent system information:")
-    _, platform = idaes.commands.util.download_bin._get_arch_and_platform(fd, "auto")
+    platform = _get_platform("auto")
     arch = machine()
     to_platform = canonical_distro(platform)
     to_mach = canonical_arch(arch)
@@ -235,36 +251,38 @@ def hash_extensions(release, path):
     if path is not None:
         hfile = os.path.join(path, hfile)
 
-    def _write_hash(fp, pack, plat):
-        f = f"idaes-{pack}-{plat}.tar.gz"
-        if path is not None:
-            h = idaes.commands.util.download_bin.hash_file_sha256(os.path.join(path, f))
-        else:
-            h = idaes.commands.util.download_bin.hash_file_sha256(f)
-        fp.write(h)
-        fp.write("  ")
-        fp.write(f)
-        fp.write("\n")
-
-    with open(hfile, "w") as f:
-        for plat in idaes.config.base_platforms:
-            for pack in ["solvers", "lib"]:
-                _write_hash(f, pack, plat)
-        for plat in idaes.config.base_platforms:
-            for pack, sp in idaes.config.extra_binaries.items():
-                if plat not in sp:
-                    continue
-                _write_hash(f, pack, plat)
+    jobs = []
+    for plat in idaes.config.base_platforms:
+        for pack in ["solvers", "lib"]:
+            jobs.append((pack, plat))
+    for plat in idaes.config.base_platforms:
+        for pack, sp in idaes.config.extra_binaries.items():
+            if plat not in sp:
+                continue
+            jobs.append((pack, plat))
+    out_names = [f"idaes-{pack}-{plat}.tar.gz" for pack, plat in jobs]
+    if path is not None:
+        full_paths = [os.path.join(path, f) for f in out_names]
+    else:
+        full_paths = out_names
+
+    # Hashing the release tarballs is CPU bound and independent per file, so
+    # spread it over a process pool. map() keeps results in submission order.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        hashes = list(
+            executor.map(idaes.commands.util.download_bin.hash_file_sha256, full_paths)
+        )
+
+    with open(hfile, "w") as fp:
+        for f, h in zip(out_names, hashes):
+            fp.write(f"{h}  {f}\n")
 
 
 @cb.command(name="bin-platform", help="Show the compatible binary build.")
 @click.option("--distro", default="auto")
 def bin_platform(distro):
-    fd, _ = idaes.commands.util.download_bin._get_file_downloader(False, None)
+    platform = _get_platform(distro)
     try:
-        _, platform = idaes.commands.util.download_bin._get_arch_and_platform(
-            fd, distro
-        )
         click.echo(idaes.commands.util.download_bin._get_release_platform(platform))
     except idaes.commands.util.download_bin.UnsupportedPlatformError:
         click.echo(
@@ -15,6 +15,7 @@ Tests for idaes.commands
 """
 # stdlib
 from functools import partial
+import hashlib
 import json
 import logging
 import os
@@ -147,6 +148,26 @@ def test_extensions_info(runner):
     assert result.exit_code == 0
 
 
+@pytest.mark.unit
+def test_hash_extensions(runner, tempdir):
+    expected = []
+    for plat in idaes.config.base_platforms:
+        for pack in ["solvers", "lib"]:
+            expected.append(f"idaes-{pack}-{plat}.tar.gz")
+    for plat in idaes.config.base_platforms:
+        for pack, sp in idaes.config.extra_binaries.items():
+            if plat in sp:
+                expected.append(f"idaes-{pack}-{plat}.tar.gz")
+    for f in expected:
+        (tempdir / f).write_bytes(f.encode())
+    result = runner.invoke(
+        extensions.hash_extensions, ["--release", "test", "--path", str(tempdir)]
+    )
+    assert result.exit_code == 0
+    lines = (tempdir / "sha256sum_test.txt").read_text().splitlines()
+    assert lines == [f"{hashlib.sha256(f.encode()).hexdigest()}  {f}" for f in expected]
+
+
 ###########
 # config  #
 ###########
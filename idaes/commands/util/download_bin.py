@@ -19,6 +19,7 @@
 
 import os
 import hashlib
+import mmap
 from platform import machine
 import tarfile
 import urllib
@@ -37,9 +38,15 @@ class UnsupportedPlatformError(RuntimeError):
     pass
 
 
+_MMAP_HASH_MIN_SIZE = 8 * 1024 * 1024
+
+
 def hash_file_sha256(fname):
     """Calculate sha256 hash of potentially large files.
 
+    Files of at least 8 MiB are memory mapped and hashed with a single
+    ``update()`` call; smaller files are read in chunks.
+
     Args:
         fname: path to file to hash
 
@@ -48,11 +55,15 @@ def hash_file_sha256(fname):
     """
     with open(fname, "rb") as f:
         fh = hashlib.sha256()
-        while True:
-            fb = f.read(10000)
-            if len(fb) <= 0:
-                break
-            fh.update(fb)
+        if os.fstat(f.fileno()).st_size >= _MMAP_HASH_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                fh.update(mm)
+        else:
+            while True:
+                fb = f.read(10000)
+                if len(fb) <= 0:
+                    break
+                fh.update(fb)
     return str(fh.hexdigest())
 
 
@@ -12,6 +12,7 @@
 #################################################################################
 import pytest
 import base64
+import hashlib
 import io
 import os
 import tarfile
@@ -37,6 +38,21 @@ def _del_data_file(path):
         pass
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [0, 12345, dlb._MMAP_HASH_MIN_SIZE + 12345])
+def test_hash_file_sha256(size):
+    data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+
+    tmpdir = tempfile.mkdtemp()
+    target = os.path.join(tmpdir, "bin.tar.gz")
+    with open(target, "wb") as f:
+        f.write(data)
+
+    assert dlb.hash_file_sha256(target) == hashlib.sha256(data).hexdigest()
+
+    shutil.rmtree(tmpdir)
+
+
 @pytest.mark.unit
 def test_get_file_downloader():
     fd, arch = dlb._get_file_downloader(insecure=True, cacert=None)